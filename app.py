@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
 from datetime import datetime
 
 # Configure the page
@@ -27,17 +29,27 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# Scatter plots are drawn from a random sample above this many rows
+SCATTER_SAMPLE_SIZE = 50_000
+
+# Stars vs Forks switches from a scatter to a binned heatmap above this many rows
+DENSITY_HEATMAP_THRESHOLD = 10_000
+
+# Filter states kept by each per-filter cache; older entries are evicted
+FILTER_CACHE_ENTRIES = 32
+
 @st.cache_data
 def load_data():
     """Load and preprocess the dataset with caching"""
-    data = pd.read_csv("github_dataset.csv")
-    # Clean the data
-    data['language'] = data['language'].fillna('Not Specified')
-    data['stars_count'] = pd.to_numeric(data['stars_count'], errors='coerce').fillna(0).astype(int)
-    data['forks_count'] = pd.to_numeric(data['forks_count'], errors='coerce').fillna(0).astype(int)
-    data['contributors'] = pd.to_numeric(data['contributors'], errors='coerce').fillna(0).astype(int)
-    data['issues_count'] = pd.to_numeric(data['issues_count'], errors='coerce').fillna(0).astype(int)
-    return data
+    # Numeric columns are already cleaned and typed by convert_dataset.py
+    data = pd.read_parquet("github_dataset.parquet", dtype_backend='pyarrow')
+    # A categorical keeps one copy of each language and filters on its codes
+    data['language'] = data['language'].fillna('Not Specified').astype('category')
+
+    # Widget bounds are computed here once instead of on every rerun
+    star_bounds = (int(data['stars_count'].min()), int(data['stars_count'].max()))
+    languages = data['language'].cat.categories.tolist()
+    return data, star_bounds, languages
 
 def format_number(num):
     """Format large numbers for better readability"""
@@ -47,9 +59,178 @@ def format_number(num):
         return f"{num/1e3:.1f}K"
     return f"{num:.0f}"
 
+def format_series(series):
+    """Format a numeric Series like format_number in one vectorized pass"""
+    values = series.to_numpy(dtype=float)
+    formatted = np.select(
+        [values >= 1e6, values >= 1e3],
+        [np.char.mod("%.1fM", values / 1e6), np.char.mod("%.1fK", values / 1e3)],
+        default=np.char.mod("%.0f", values)
+    )
+    return pd.Series(formatted, index=series.index, name=series.name)
+
+def scatter_sample(data):
+    """Limit a frame to at most SCATTER_SAMPLE_SIZE rows for plotting"""
+    if len(data) > SCATTER_SAMPLE_SIZE:
+        return data.sample(n=SCATTER_SAMPLE_SIZE, random_state=0)
+    return data
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def filter_mask(languages, star_range):
+    """Build the row mask for the sidebar filters"""
+    data, _, _ = load_data()
+
+    # Build a single fused mask on the raw arrays instead of chaining frames
+    stars = data['stars_count'].to_numpy()
+    mask = (stars >= star_range[0]) & (stars <= star_range[1])
+
+    # An empty language tuple means "All"
+    if languages:
+        mask &= data['language'].isin(languages).to_numpy()
+    return mask
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def apply_filters(languages, star_range, columns=None):
+    """Apply the sidebar filters, materializing only the requested columns"""
+    data, _, _ = load_data()
+    if columns is not None:
+        data = data[list(columns)]
+    return data[filter_mask(languages, star_range)]
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def metrics(filter_key):
+    """Compute the key metric values for the filtered data"""
+    columns = ('stars_count', 'forks_count', 'contributors')
+    filtered_data = apply_filters(*filter_key, columns=columns)
+    return (
+        len(filtered_data),
+        filtered_data['stars_count'].sum(),
+        filtered_data['forks_count'].sum(),
+        filtered_data['contributors'].mean()
+    )
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def top_repositories(filter_key):
+    """Select the ten most starred repositories with formatted counts"""
+    columns = ('repositories', 'language', 'stars_count', 'forks_count', 'contributors')
+    top_repos = apply_filters(*filter_key, columns=columns)
+
+    # Partially sort the star counts so only the top ten get ordered
+    stars = top_repos['stars_count'].to_numpy()
+    top = np.arange(len(stars))
+    if len(stars) > 10:
+        # Like nlargest, ties at the tenth value are taken in row order
+        threshold = np.partition(stars, len(stars) - 10)[len(stars) - 10]
+        above = np.flatnonzero(stars > threshold)
+        tied = np.flatnonzero(stars == threshold)[:10 - len(above)]
+        top = np.concatenate([above, tied])
+    top_repos = top_repos.iloc[top[np.argsort(-stars[top], kind='stable')]]
+
+    # Format the numbers in the table
+    return top_repos.assign(
+        stars_count=format_series(top_repos['stars_count']),
+        forks_count=format_series(top_repos['forks_count'])
+    )
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def filtered_csv(filter_key):
+    """Serialize the filtered data to CSV once per filter key"""
+    return apply_filters(*filter_key).to_csv(index=False).encode()
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def language_pie(filter_key):
+    """Build the pie chart of the ten most common languages"""
+    languages = apply_filters(*filter_key, columns=('language',))
+    # observed=True skips the categories removed by the language filter
+    counts = languages.groupby('language', sort=False, observed=True).size()
+    lang_dist = counts.nlargest(10)
+    return px.pie(
+        values=lang_dist.values,
+        names=lang_dist.index,
+        title="Top 10 Languages",
+        hole=0.3
+    )
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def stars_forks_figure(filter_key):
+    """Build the Stars vs Forks chart, binned for large selections"""
+    columns = ('repositories', 'language', 'stars_count', 'forks_count', 'contributors')
+    filtered_data = apply_filters(*filter_key, columns=columns)
+    if len(filtered_data) > DENSITY_HEATMAP_THRESHOLD:
+        # Bin on the server so the browser only receives the 60x60 counts;
+        # zero counts fall outside the log-spaced edges, as on a log scatter
+        stars = filtered_data['stars_count'].to_numpy()
+        forks = filtered_data['forks_count'].to_numpy()
+        x_edges = np.geomspace(1, max(stars.max(), 2), 61)
+        y_edges = np.geomspace(1, max(forks.max(), 2), 61)
+        counts, _, _ = np.histogram2d(stars, forks, bins=[x_edges, y_edges])
+        fig = go.Figure(go.Heatmap(
+            z=np.where(counts > 0, counts, np.nan).T,
+            x=x_edges,
+            y=y_edges,
+            colorbar={'title': 'count'}
+        ))
+        fig.update_xaxes(type='log', title='stars_count')
+        fig.update_yaxes(type='log', title='forks_count')
+        fig.update_layout(title="Stars vs Forks Density (log scale)")
+        return fig
+    return px.scatter(
+        filtered_data,
+        x='stars_count',
+        y='forks_count',
+        color='language',
+        size='contributors',
+        hover_data=['repositories'],
+        log_x=True,
+        log_y=True,
+        render_mode='webgl',
+        title="Stars vs Forks (log scale)"
+    )
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def issues_contributors_figure(filter_key):
+    """Build the Issues vs Contributors scatter plot"""
+    columns = ('repositories', 'language', 'stars_count', 'issues_count', 'contributors')
+    return px.scatter(
+        scatter_sample(apply_filters(*filter_key, columns=columns)),
+        x='issues_count',
+        y='contributors',
+        color='language',
+        size='stars_count',
+        hover_data=['repositories'],
+        render_mode='webgl',
+        title="Issues vs Contributors Correlation"
+    )
+
+def render_overview(filter_key):
+    """Render the Overview tab for the given filter key"""
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Language Distribution
+        st.subheader("Language Distribution")
+        st.plotly_chart(language_pie(filter_key), use_container_width=True)
+
+    with col2:
+        # Stars vs Forks
+        st.subheader("Stars vs Forks Correlation")
+        st.plotly_chart(stars_forks_figure(filter_key), use_container_width=True)
+
+def render_details(filter_key):
+    """Render the Detailed Analysis tab for the given filter key"""
+    # Top Repositories Table
+    st.subheader("Top Repositories")
+    top_repos = top_repositories(filter_key)
+
+    st.dataframe(top_repos, hide_index=True)
+
+    # Issues vs Contributors
+    st.subheader("Issues vs Contributors Analysis")
+    st.plotly_chart(issues_contributors_figure(filter_key), use_container_width=True)
+
 # Load data
 try:
-    data = load_data()
+    _, star_bounds, languages = load_data()
 
     # Title and description
     col1, col2 = st.columns([2, 1])
@@ -65,7 +246,7 @@ try:
         st.header("📎 Filters")
 
         # Language filter with select all option
-        all_languages = ['All'] + sorted(data['language'].unique().tolist())
+        all_languages = ['All'] + languages
         selected_languages = st.multiselect(
             "Select Languages",
             all_languages,
@@ -75,101 +256,44 @@ try:
         # Star count range filter
         star_range = st.slider(
             "Stars Count Range",
-            min_value=int(data['stars_count'].min()),
-            max_value=int(data['stars_count'].max()),
-            value=(int(data['stars_count'].min()), int(data['stars_count'].max()))
+            min_value=star_bounds[0],
+            max_value=star_bounds[1],
+            value=star_bounds
         )
 
-    # Apply filters
-    filtered_data = data.copy()
-
-    # Check if any specific language is selected; if not, default to "All"
+    # Apply filters; the tuple key lets every cached panel below reuse the result
     if selected_languages and 'All' not in selected_languages:
-        filtered_data = filtered_data[filtered_data['language'].isin(selected_languages)]
-
-    # Check for a valid star range
-    if star_range:
-        filtered_data = filtered_data[
-            (filtered_data['stars_count'] >= star_range[0]) & 
-            (filtered_data['stars_count'] <= star_range[1])
-        ]
+        filter_key = (tuple(sorted(selected_languages)), tuple(star_range))
+    else:
+        filter_key = ((), tuple(star_range))
+    total_repos, total_stars, total_forks, avg_contributors = metrics(filter_key)
 
     # Key Metrics
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Repositories", len(filtered_data))
+        st.metric("Total Repositories", total_repos)
     with col2:
-        st.metric("Total Stars", format_number(filtered_data['stars_count'].sum()))
+        st.metric("Total Stars", format_number(total_stars))
     with col3:
-        st.metric("Total Forks", format_number(filtered_data['forks_count'].sum()))
+        st.metric("Total Forks", format_number(total_forks))
     with col4:
-        st.metric("Avg Contributors", format_number(int(filtered_data['contributors'].mean())))
+        st.metric("Avg Contributors", format_number(int(avg_contributors)))
 
     # Main content in tabs
     tab1, tab2 = st.tabs(["📊 Overview", "🔍 Detailed Analysis"])
 
     with tab1:
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Language Distribution
-            st.subheader("Language Distribution")
-            lang_dist = filtered_data['language'].value_counts().head(10)
-            fig = px.pie(
-                values=lang_dist.values,
-                names=lang_dist.index,
-                title="Top 10 Languages",
-                hole=0.3
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        with col2:
-            # Stars vs Forks
-            st.subheader("Stars vs Forks Correlation")
-            fig = px.scatter(
-                filtered_data,
-                x='stars_count',
-                y='forks_count',
-                color='language',
-                size='contributors',
-                hover_data=['repositories'],
-                log_x=True,
-                log_y=True,
-                title="Stars vs Forks (log scale)"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        render_overview(filter_key)
 
     with tab2:
-        # Top Repositories Table
-        st.subheader("Top Repositories")
-        top_repos = filtered_data.nlargest(10, 'stars_count')[
-            ['repositories', 'language', 'stars_count', 'forks_count', 'contributors']
-        ]
-
-        # Format the numbers in the table
-        top_repos['stars_count'] = top_repos['stars_count'].apply(format_number)
-        top_repos['forks_count'] = top_repos['forks_count'].apply(format_number)
-
-        st.dataframe(top_repos, hide_index=True)
-
-        # Issues vs Contributors
-        st.subheader("Issues vs Contributors Analysis")
-        fig = px.scatter(
-            filtered_data,
-            x='issues_count',
-            y='contributors',
-            color='language',
-            size='stars_count',
-            hover_data=['repositories'],
-            title="Issues vs Contributors Correlation"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        render_details(filter_key)
 
     # Download Filtered Data
     st.subheader("Download Filtered Data")
     st.download_button(
         label="Download Filtered GitHub Data as CSV",
-        data=filtered_data.to_csv(index=False),
+        # Only serialized when the button is clicked
+        data=lambda: filtered_csv(filter_key),
         file_name="filtered_github_data.csv",
         mime="text/csv"
     )
@@ -187,11 +311,7 @@ try:
     )
 
 except FileNotFoundError:
-    st.error("Dataset file not found. Please make sure the file 'github_dataset.csv' exists.")
-except pd.errors.EmptyDataError:
-    st.error("The dataset file is empty. Please provide a valid dataset.")
-except pd.errors.ParserError:
-    st.error("Error parsing the dataset file. Please check the file format.")
+    st.error("Dataset file not found. Please run 'python convert_dataset.py' to create 'github_dataset.parquet'.")
 except KeyError as e:
     st.error(f"Column missing: {e}. Please ensure the dataset has all required columns.")
 except Exception as e:
@@ -0,0 +1,14 @@
+import pandas as pd
+
+# Columns that may contain non-numeric values in the raw CSV export
+NUMERIC_COLUMNS = ['stars_count', 'forks_count', 'contributors', 'issues_count']
+
+def convert_dataset(source="github_dataset.csv", target="github_dataset.parquet"):
+    """Clean the raw CSV once and store it as typed, columnar Parquet"""
+    data = pd.read_csv(source)
+    for column in NUMERIC_COLUMNS:
+        data[column] = pd.to_numeric(data[column], errors='coerce').fillna(0).astype('int32')
+    data.to_parquet(target, compression='zstd', index=False)
+
+if __name__ == "__main__":
+    convert_dataset()